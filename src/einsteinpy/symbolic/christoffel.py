@@ -1,3 +1,5 @@
+from itertools import product
+
 import numpy as np
 import sympy
 
@@ -71,12 +73,8 @@ class ChristoffelSymbols(Tensor):
         tmplist = np.zeros((dims, dims, dims), dtype=int).tolist()
         mat, syms = metric_cov.tensor(), metric_cov.symbols()
         matinv = sympy.Matrix(mat.tolist()).inv()
-        for t in range(dims ** 3):
-            # i,j,k each goes from 0 to (dims-1)
-            # hack for codeclimate. Could be done with 3 nested for loops
-            k = t % dims
-            j = (int(t / dims)) % (dims)
-            i = (int(t / (dims ** 2))) % (dims)
+        # i,j,k each goes from 0 to (dims-1)
+        for i, j, k in product(range(dims), repeat=3):
             tmpvar = 0
             for n in range(dims):
                 tmpvar += (matinv[i, n] / 2) * (
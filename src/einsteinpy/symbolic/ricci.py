@@ -1,10 +1,28 @@
+import weakref
+
+import numpy as np
 import sympy
-from sympy import tensorcontraction, tensorproduct
 
 from einsteinpy.symbolic.christoffel import ChristoffelSymbols
 from einsteinpy.symbolic.metric import MetricTensor
-from einsteinpy.symbolic.riemann import RiemannCurvatureTensor
-from einsteinpy.symbolic.tensor import Tensor, _change_config
+from einsteinpy.symbolic.tensor import Tensor, _change_config, _is_numerical, _jitted
+
+# Results of ``from_metric`` keyed by (class, id(metric)). The cached objects
+# keep their parent metric alive, so the id can not be reused by another
+# metric as long as the entry exists.
+_from_metric_cache: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+# Ricci Tensors keyed by the Riemann Tensor they were contracted from
+_from_riemann_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _ricci_numeric_kernel(riemann, ricci):
+    # contraction of 1st & 3rd index of a numerical (ulll) Riemann Tensor
+    dims = ricci.shape[0]
+    for i in range(dims):
+        for j in range(dims):
+            for k in range(dims):
+                ricci[i, j] += riemann[k, i, k, j]
+    return ricci
 
 
 class RicciTensor(Tensor):
@@ -42,7 +60,7 @@ class RicciTensor(Tensor):
         self._order = 2
         self._parent_metric = parent_metric
         if isinstance(syms, (list, tuple)):
-            self.syms = syms
+            self.syms = tuple(syms)
             self.dims = len(self.syms)
         else:
             raise TypeError("syms should be a list or tuple")
@@ -61,6 +79,9 @@ class RicciTensor(Tensor):
         """
         Get Ricci Tensor calculated from Riemann Tensor
 
+        If all the components of the Riemann Tensor are numbers, and some are floats,
+        the contraction is done numerically and the components are returned as floats.
+
         Parameters
         ----------
         riemann : ~einsteinpy.symbolic.riemann.RiemannCurvatureTensor
@@ -71,16 +92,42 @@ class RicciTensor(Tensor):
             Defaults to None.
 
         """
+        # only the inherited parent metric is cached
+        use_cache = parent_metric is None
+        if use_cache and riemann in _from_riemann_cache:
+            return _from_riemann_cache[riemann]
+        riemann_ulll = riemann
         if not riemann.config == "ulll":
-            riemann = riemann.change_config(newconfig="ulll", metric=parent_metric)
+            riemann_ulll = riemann.change_config(newconfig="ulll", metric=parent_metric)
         if parent_metric is None:
-            parent_metric = riemann.parent_metric
-        return cls(
-            sympy.tensorcontraction(riemann.tensor(), (0, 2)),
+            parent_metric = riemann_ulll.parent_metric
+        riemann_list = riemann_ulll.tensor().tolist()
+        dims = len(riemann_list)
+        if _is_numerical(riemann_list):
+            arr = _jitted(_ricci_numeric_kernel)(
+                np.asarray(riemann_list, dtype=np.float64), np.zeros((dims, dims))
+            )
+            arr = sympy.Array(arr.tolist())
+        else:
+            # contraction of 1st & 3rd index, summed directly
+            arr = sympy.Array(
+                [
+                    [
+                        sympy.Add(*(riemann_list[k][i][k][j] for k in range(dims)))
+                        for j in range(dims)
+                    ]
+                    for i in range(dims)
+                ]
+            )
+        ricci = cls(
+            arr,
             riemann.syms,
             config="ll",
             parent_metric=parent_metric,
         )
+        if use_cache:
+            _from_riemann_cache[riemann] = ricci
+        return ricci
 
     @classmethod
     def from_christoffels(cls, chris, parent_metric=None):
@@ -97,24 +144,52 @@ class RicciTensor(Tensor):
             Defaults to None.
 
         """
-        rt = RiemannCurvatureTensor.from_christoffels(
-            chris, parent_metric=parent_metric
-        )
-        return cls.from_riemann(rt)
+        if not chris.config == "ull":
+            chris = chris.change_config(newconfig="ull", metric=parent_metric)
+        arr, syms = chris.tensor(), chris.symbols()
+        dims = len(syms)
+        # R_sn is calculated directly, as the contraction of 1st & 3rd index
+        # of the Riemann Tensor, without calculating the Riemann Tensor
+        ricci_list = list()
+        for s in range(dims):
+            row = list()
+            for n in range(dims):
+                temp = 0
+                for t in range(dims):
+                    temp += sympy.diff(arr[t, s, n], syms[t]) - sympy.diff(
+                        arr[t, t, n], syms[s]
+                    )
+                    for p in range(dims):
+                        temp += (
+                            arr[p, s, n] * arr[t, p, t] - arr[p, t, n] * arr[t, p, s]
+                        )
+                row.append(sympy.simplify(temp))
+            ricci_list.append(row)
+        if parent_metric is None:
+            parent_metric = chris.parent_metric
+        return cls(ricci_list, syms, config="ll", parent_metric=parent_metric)
 
     @classmethod
     def from_metric(cls, metric):
         """
         Get Ricci Tensor calculated from Metric Tensor
 
+        Results are cached as long as they are referenced,
+        so repeated calls with the same metric are not recalculated.
+
         Parameters
         ----------
         metric : ~einsteinpy.symbolic.metric.MetricTensor
             Metric Tensor
 
         """
-        ch = ChristoffelSymbols.from_metric(metric)
-        return cls.from_christoffels(ch, parent_metric=None)
+        key = (cls, id(metric))
+        ricci = _from_metric_cache.get(key)
+        if ricci is None:
+            ch = ChristoffelSymbols.from_metric(metric)
+            ricci = cls.from_christoffels(ch, parent_metric=None)
+            _from_metric_cache[key] = ricci
+        return ricci
 
     def change_config(self, newconfig="ul", metric=None):
         """
@@ -192,7 +267,7 @@ class RicciScalar:
         self._parent_metric = parent_metric
         self._expr = expression
         if isinstance(syms, (list, tuple)):
-            self.syms = syms
+            self.syms = tuple(syms)
             self.dims = len(self.syms)
         else:
             raise TypeError("syms should be a list or tuple")
@@ -212,7 +287,7 @@ class RicciScalar:
         return self._parent_metric
 
     @classmethod
-    def from_riccitensor(cls, riccitensor, parent_metric=None):
+    def from_riccitensor(cls, riccitensor, parent_metric=None, backend="auto"):
         """
         Get Ricci Scalar calculated from Ricci Tensor
 
@@ -223,16 +298,38 @@ class RicciScalar:
         parent_metric : ~einsteinpy.symbolic.metric.MetricTensor or None
             Corresponding Metric for the Ricci Scalar.
             Defaults to None.
+        backend : str
+            'sympy' for a symbolic trace, 'numpy' for a numerical trace, returned as a float.
+            'auto' uses numpy if all the components are numbers and some are floats.
+            Defaults to 'auto'.
 
-        """
+        Raises
+        ------
+        ValueError
+            Raised when backend is not 'auto', 'numpy' or 'sympy'
+        ValueError
+            Raised when backend is 'numpy' and the Ricci Tensor has symbolic components
 
+        """
+        if backend not in ("auto", "numpy", "sympy"):
+            raise ValueError("backend should be 'auto', 'numpy' or 'sympy'")
         if not riccitensor.config == "ul":
             riccitensor = riccitensor.change_config(
                 newconfig="ul", metric=parent_metric
             )
         if parent_metric is None:
             parent_metric = riccitensor.parent_metric
-        ricci_scalar = tensorcontraction(riccitensor.tensor(), (0, 1))
+        arr = riccitensor.tensor()
+        if backend == "auto":
+            backend = "numpy" if _is_numerical(arr.tolist()) else "sympy"
+        elif backend == "numpy" and not all(x.is_Number for x in sympy.flatten(arr)):
+            raise ValueError("numpy backend needs numerical components")
+        if backend == "numpy":
+            ricci_scalar = sympy.Float(
+                np.trace(np.asarray(arr.tolist(), dtype=np.float64))
+            )
+        else:
+            ricci_scalar = sympy.Add(*(arr[i, i] for i in range(arr.shape[0])))
         return cls(ricci_scalar, riccitensor.syms, parent_metric=parent_metric)
 
     @classmethod
@@ -267,21 +364,26 @@ class RicciScalar:
             Defaults to None.
 
         """
-        rt = RiemannCurvatureTensor.from_christoffels(
-            chris, parent_metric=parent_metric
-        )
-        return cls.from_riemann(rt)
+        rt = RicciTensor.from_christoffels(chris, parent_metric=parent_metric)
+        return cls.from_riccitensor(rt)
 
     @classmethod
     def from_metric(cls, metric):
         """
         Get Ricci Scalar calculated from Metric Tensor
 
+        Results are cached as long as they are referenced,
+        so repeated calls with the same metric are not recalculated.
+
         Parameters
         ----------
         metric : ~einsteinpy.symbolic.metric.MetricTensor
             Metric Tensor
 
         """
-        ch = ChristoffelSymbols.from_metric(metric)
-        return cls.from_christoffels(ch, parent_metric=None)
+        key = (cls, id(metric))
+        ricci_scalar = _from_metric_cache.get(key)
+        if ricci_scalar is None:
+            ricci_scalar = cls.from_riccitensor(RicciTensor.from_metric(metric))
+            _from_metric_cache[key] = ricci_scalar
+        return ricci_scalar
@@ -1,3 +1,5 @@
+from itertools import product
+
 import numpy as np
 import sympy
 
@@ -73,13 +75,8 @@ class RiemannCurvatureTensor(Tensor):
         arr, syms = chris.tensor(), chris.symbols()
         dims = len(syms)
         riemann_list = (np.zeros(shape=(dims, dims, dims, dims), dtype=int)).tolist()
-        for i in range(dims ** 4):
-            # t,s,r,n each goes from 0 to (dims-1)
-            # hack for codeclimate. Could be done with 4 nested for loops
-            n = i % dims
-            r = (int(i / dims)) % (dims)
-            s = (int(i / (dims ** 2))) % (dims)
-            t = (int(i / (dims ** 3))) % (dims)
+        # t,s,r,n each goes from 0 to (dims-1)
+        for t, s, r, n in product(range(dims), repeat=4):
             temp = sympy.diff(arr[t, s, n], syms[r]) - sympy.diff(arr[t, r, n], syms[s])
             for p in range(dims):
                 temp += arr[p, s, n] * arr[t, p, r] - arr[p, r, n] * arr[t, p, s]
@@ -1,6 +1,9 @@
-import numpy as np
+from itertools import product
+
 import sympy
-from sympy import simplify, tensorcontraction, tensorproduct
+from sympy import simplify
+
+_jitted_kernels: dict = {}
 
 
 def _config_checker(config):
@@ -13,6 +16,23 @@ def _config_checker(config):
     return True
 
 
+def _is_numerical(values):
+    # check if all values are numbers and at least one of them is a float
+    # exact (integer or rational) components are kept symbolic
+    values = sympy.flatten(values)
+    return all(x.is_Number for x in values) and any(x.is_Float for x in values)
+
+
+def _jitted(kernel):
+    # numerical kernels are compiled on first use, because importing
+    # einsteinpy.ijit warns when numba is not installed
+    if kernel not in _jitted_kernels:
+        from einsteinpy.ijit import jit
+
+        _jitted_kernels[kernel] = jit(cache=True)(kernel)
+    return _jitted_kernels[kernel]
+
+
 def _difference_list(newconfig, oldconfig):
     # defines a list of actions to be taken on a tensor
     difflist = list()
@@ -26,6 +46,22 @@ def _difference_list(newconfig, oldconfig):
     return difflist
 
 
+def _contract_index(met, arr, index):
+    # contracts the 2nd index of met with the given index of arr
+    # sums over the contracted index directly, instead of building the
+    # (much larger) tensor product of met and arr
+    dims = arr.shape[index]
+    components = list()
+    for idx in product(*(range(n) for n in arr.shape)):
+        head, tail = idx[:index], idx[index + 1 :]
+        components.append(
+            sympy.Add(
+                *(met[idx[index], s] * arr[head + (s,) + tail] for s in range(dims))
+            )
+        )
+    return sympy.Array(components, arr.shape)
+
+
 def _change_config(tensor, metric, newconfig):
     # check length and validity of new configuration
     if not (len(newconfig) == len(tensor.config) and _config_checker(newconfig)):
@@ -45,19 +81,7 @@ def _change_config(tensor, metric, newconfig):
             if action == 0:
                 continue
             else:
-                t = simplify(
-                    tensorcontraction(tensorproduct(met_dict[action], t), (1, 2 + i))
-                )
-                # reshuffle the indices
-                tmp = np.array(t).reshape(t.shape)
-                source, dest = (
-                    [p for p in range(len(t.shape))],
-                    [p for p in range(len(t.shape))],
-                )
-                dest.pop(i)
-                dest.insert(0, i)
-                tmp = np.moveaxis(tmp, source, dest)
-                t = sympy.Array(tmp)
+                t = simplify(_contract_index(met_dict[action], t, i))
         return t
 
     return chain_config_change()
@@ -1,9 +1,116 @@
+import weakref
+from itertools import product
+from multiprocessing import Pool, current_process
+
 import numpy as np
 import sympy
+from sympy import permutedims, tensorproduct
 
-from einsteinpy.symbolic.ricci import RicciScalar, RicciTensor
+from einsteinpy.symbolic.ricci import RicciTensor
 from einsteinpy.symbolic.riemann import RiemannCurvatureTensor
-from einsteinpy.symbolic.tensor import Tensor, _change_config
+from einsteinpy.symbolic.tensor import Tensor, _change_config, _is_numerical, _jitted
+
+# Results of ``from_metric`` keyed by (class, id(metric)). The cached tensors
+# keep their parent metric alive, so the id can not be reused by another
+# metric as long as the entry exists.
+_from_metric_cache: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+
+
+def _permuted(arr, subscripts):
+    # permutes the indices of arr with einsum like subscripts,
+    # e.g. 'imkl->iklm' gives T[i, k, l, m] = arr[i, m, k, l]
+    inputs, output = subscripts.split("->")
+    return permutedims(arr, [inputs.index(ch) for ch in output])
+
+
+def _simplify_component(expr):
+    # components which are already zero are not simplified, and the cheaper
+    # cancel is tried first, as it already reduces many components to zero
+    if expr == 0:
+        return sympy.S.Zero
+    expr = sympy.cancel(expr)
+    if expr == 0:
+        return expr
+    return sympy.simplify(expr)
+
+
+def _weyl_symbolic(riem, ricci, g, R, parallel=False):
+    dims = len(g)
+    ricci, g = sympy.Array(ricci), sympy.Array(g)
+    # the Ricci terms are index permutations of the same outer product of
+    # Ricci Tensor and metric, and the scalar terms of the outer product of
+    # the metric with itself, so each product is only built once
+    ricci_g, g_g = tensorproduct(ricci, g), tensorproduct(g, g)
+    ricci_term = (
+        _permuted(ricci_g, "imkl->iklm")
+        - _permuted(ricci_g, "ilkm->iklm")
+        + _permuted(ricci_g, "klim->iklm")
+        - _permuted(ricci_g, "kmil->iklm")
+    )
+    scalar_term = _permuted(g_g, "ilkm->iklm") - _permuted(g_g, "imkl->iklm")
+    W = (
+        sympy.Array(riem)
+        + ricci_term / (dims - 2)
+        + R * scalar_term / ((dims - 1) * (dims - 2))
+    )
+    W = list(W.reshape(dims ** 4))
+    # Indexing for resultant Weyl Tensor is iklm, components are kept in a
+    # flat list where iklm is at ((i * dims + k) * dims + l) * dims + m
+    # Both the Riemann and the Ricci terms are invariant under
+    # iklm -> lmik and iklm -> kiml, so each component is computed
+    # once and copied to its symmetric partners
+    C = [None] * (dims ** 4)
+    partners, components = list(), list()
+    for i, k, l, m in product(range(dims), repeat=4):
+        iklm = ((i * dims + k) * dims + l) * dims + m
+        if C[iklm] is not None:
+            continue
+        lmik = ((l * dims + m) * dims + i) * dims + k
+        kiml = ((k * dims + i) * dims + m) * dims + l
+        mlki = ((m * dims + l) * dims + k) * dims + i
+        C[iklm] = C[lmik] = C[kiml] = C[mlki] = W[iklm]
+        partners.append((iklm, lmik, kiml, mlki))
+        components.append(W[iklm])
+    # components are simplified independently of each other, so they can be
+    # spread over worker processes. A pool is not started if there is nothing
+    # left to simplify, or from a daemonic process (e.g. a Pool worker), which
+    # is not allowed to have children
+    if (
+        parallel
+        and any(val != 0 for val in components)
+        and not current_process().daemon
+    ):
+        with Pool() as pool:
+            components = pool.map(_simplify_component, components)
+    else:
+        components = list(map(_simplify_component, components))
+    for (iklm, lmik, kiml, mlki), val in zip(partners, components):
+        C[iklm] = C[lmik] = C[kiml] = C[mlki] = val
+    return sympy.Array(C, (dims, dims, dims, dims))
+
+
+def _weyl_numeric_kernel(riemann, ricci, g, R, C):
+    # same formula as _weyl_symbolic, for numerical components,
+    # with n in place of the index l
+    dims = g.shape[0]
+    for i in range(dims):
+        for k in range(dims):
+            for n in range(dims):
+                for m in range(dims):
+                    C[i, k, n, m] = (
+                        riemann[i, k, n, m]
+                        + (
+                            ricci[i, m] * g[k, n]
+                            - ricci[i, n] * g[k, m]
+                            + ricci[k, n] * g[i, m]
+                            - ricci[k, m] * g[i, n]
+                        )
+                        / (dims - 2)
+                        + R
+                        * (g[i, n] * g[k, m] - g[i, m] * g[k, n])
+                        / ((dims - 1) * (dims - 2))
+                    )
+    return C
 
 
 class WeylTensor(Tensor):
@@ -40,7 +147,7 @@ class WeylTensor(Tensor):
         self._order = 4
         self._parent_metric = parent_metric
         if isinstance(syms, (list, tuple)):
-            self.syms = syms
+            self.syms = tuple(syms)
             self.dims = len(self.syms)
         else:
             raise TypeError("syms should be a list or tuple")
@@ -55,14 +162,22 @@ class WeylTensor(Tensor):
         return self._parent_metric
 
     @classmethod
-    def from_metric(cls, metric):
+    def from_metric(cls, metric, parallel=False):
         """
         Get Weyl tensor calculated from a metric tensor
 
+        Results are cached as long as they are referenced,
+        so repeated calls with the same metric are not recalculated.
+        If the Riemann Tensor, Ricci Tensor and the metric only have numerical components,
+        and some are floats, the Weyl Tensor is calculated numerically and its components are returned as floats.
+
         Parameters
         ----------
         metric : ~einsteinpy.symbolic.metric.MetricTensor
             Space-time Metric from which Christoffel Symbols are to be calculated
+        parallel : bool
+            If True, the components are simplified in parallel, using a :class:`multiprocessing.pool.Pool`.
+            Defaults to False.
 
         Raises
         ------
@@ -70,6 +185,10 @@ class WeylTensor(Tensor):
             Raised when the dimension of the tensor is less than 3
 
         """
+        key = (cls, id(metric))
+        weyl = _from_metric_cache.get(key)
+        if weyl is not None:
+            return weyl
         if metric.dims > 3:
             if metric.config == "uu":
                 # Metric tensor with covariant indices required
@@ -80,44 +199,46 @@ class WeylTensor(Tensor):
             # Riemann Tensor with covariant indices is needed
             t_riemann_cov = t_riemann.change_config("llll", metric=None)
             t_ricci = RicciTensor.from_riemann(t_riemann, parent_metric=None)
-            r_scalar = RicciScalar.from_riccitensor(t_ricci, parent_metric=None)
-            g = metric_cov
-            dims = g.dims
-            # Indexing for resultant Weyl Tensor is iklm
-            C = np.zeros(shape=(dims, dims, dims, dims), dtype=int).tolist()
-            for t in range(dims ** 4):
-                i, k, l, m = (
-                    t % dims,
-                    (int(t / dims)) % (dims),
-                    (int(t / (dims ** 2))) % (dims),
-                    (int(t / (dims ** 3))) % (dims),
-                )
-                C[i][k][l][m] = t_riemann_cov[i, k, l, m] + (
-                    (
-                        (
-                            t_ricci[i, m] * g[k, l]
-                            - t_ricci[i, l] * g[k, m]
-                            + t_ricci[k, l] * g[i, m]
-                            - t_ricci[k, m] * g[i, l]
-                        )
-                        / (dims - 2)
-                    )
-                    + (
-                        r_scalar.expr
-                        * (g[i, l] * g[k, m] - g[i, m] * g[k, l])
-                        / ((dims - 1) * (dims - 2))
+            dims = metric_cov.dims
+            # plain nested lists are much cheaper to index than sympy Arrays
+            riem = t_riemann_cov.tensor().tolist()
+            ricci = t_ricci.tensor().tolist()
+            g = metric_cov.tensor().tolist()
+            g_inv = metric_cov.inv().tensor().tolist()
+            # Ricci Scalar is the trace of Ricci Tensor with the inverse metric,
+            # which saves raising an index of the Ricci Tensor first
+            R = sympy.simplify(
+                sympy.Add(
+                    *(
+                        g_inv[i][j] * ricci[i][j]
+                        for i in range(dims)
+                        for j in range(dims)
                     )
                 )
-            C = sympy.simplify(sympy.Array(C))
-            return cls(C, metric.syms, config="llll", parent_metric=metric)
+            )
+            if _is_numerical([riem, ricci, g, R]):
+                C = _jitted(_weyl_numeric_kernel)(
+                    np.asarray(riem, dtype=np.float64),
+                    np.asarray(ricci, dtype=np.float64),
+                    np.asarray(g, dtype=np.float64),
+                    float(R),
+                    np.zeros((dims, dims, dims, dims)),
+                )
+                C = sympy.Array(C.tolist())
+            else:
+                C = _weyl_symbolic(riem, ricci, g, R, parallel=parallel)
+            weyl = cls(C, metric.syms, config="llll", parent_metric=metric)
         elif metric.dims == 3:
-            return cls(
-                sympy.Array(np.zeros((3, 3), dtype=int)),
+            weyl = cls(
+                sympy.Array([[0 for i in range(3)] for j in range(3)]),
                 metric.syms,
                 config="llll",
                 parent_metric=metric,
             )
-        raise ValueError("Dimension of the space/space-time should be 3 or more")
+        else:
+            raise ValueError("Dimension of the space/space-time should be 3 or more")
+        _from_metric_cache[key] = weyl
+        return weyl
 
     def change_config(self, newconfig="llll", metric=None):
         """
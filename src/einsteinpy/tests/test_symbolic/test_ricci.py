@@ -3,6 +3,7 @@ import sympy
 from sympy import cos, sin, sinh
 
 from einsteinpy.symbolic import (
+    ChristoffelSymbols,
     MetricTensor,
     RicciScalar,
     RicciTensor,
@@ -78,6 +79,36 @@ def test_RicciTensor_from_riemann_with_arbritary_config():
         assert False
 
 
+def test_RicciTensor_from_christoffels_matches_from_riemann():
+    mt = anti_de_sitter_metric()
+    ch = ChristoffelSymbols.from_metric(mt)
+    Rt1 = RicciTensor.from_christoffels(ch)
+    Rt2 = RicciTensor.from_riemann(RiemannCurvatureTensor.from_christoffels(ch))
+    assert sympy.simplify(Rt1.tensor() - Rt2.tensor()) == sympy.Array(
+        np.zeros((4, 4), dtype=int)
+    )
+    assert Rt1.parent_metric == mt
+
+
+def test_RicciTensor_from_numerical_riemann():
+    syms = sympy.symbols("t x y z")
+    testarr = (np.arange(4 ** 4) / 2).reshape((4, 4, 4, 4)).tolist()
+    rm = RiemannCurvatureTensor(testarr, syms, config="ulll")
+    Rt = RicciTensor.from_riemann(rm)
+    cmp_arr = sympy.tensorcontraction(rm.tensor(), (0, 2))
+    assert Rt.tensor() == cmp_arr
+
+
+def test_RicciTensor_from_metric_and_from_riemann_are_cached():
+    mt = anti_de_sitter_metric()
+    Rt = RicciTensor.from_metric(mt)
+    assert RicciTensor.from_metric(mt) is Rt
+    rm = RiemannCurvatureTensor.from_metric(mt)
+    Rt2 = RicciTensor.from_riemann(rm)
+    assert RicciTensor.from_riemann(rm) is Rt2
+    assert RicciTensor.from_riemann(rm, parent_metric=mt) is not Rt2
+
+
 # Tests for Ricci Scalar
 
 
@@ -88,12 +119,50 @@ def test_RicciScalar_is_constant_for_ADS_spacetime():
     assert sympy.simplify(R._expr).is_constant()
 
 
+def test_RicciScalar_from_metric_is_cached():
+    mt = anti_de_sitter_metric()
+    R = RicciScalar.from_metric(mt)
+    assert RicciScalar.from_metric(mt) is R
+    assert R.parent_metric == mt
+
+
+def test_RicciScalar_from_riccitensor_backends():
+    syms = sympy.symbols("t x")
+    mt = MetricTensor([[-1, 0], [0, 1]], syms)
+    Rt = RicciTensor([[0.5, 1], [1, 2]], syms, config="ll", parent_metric=mt)
+    R = RicciScalar.from_riccitensor(Rt)
+    assert isinstance(R.expr, sympy.Float) and R.expr == 1.5
+    Rt = RicciTensor([[1, 1], [1, 2]], syms, config="ul", parent_metric=mt)
+    assert RicciScalar.from_riccitensor(Rt).expr == sympy.Integer(3)
+    R = RicciScalar.from_riccitensor(Rt, backend="numpy")
+    assert isinstance(R.expr, sympy.Float) and R.expr == 3.0
+    try:
+        RicciScalar.from_riccitensor(Rt, backend="torch")
+        assert False
+    except ValueError:
+        assert True
+    Rt = RicciTensor([[syms[0], 1], [1, 2]], syms, config="ul", parent_metric=mt)
+    try:
+        RicciScalar.from_riccitensor(Rt, backend="numpy")
+        assert False
+    except ValueError:
+        assert True
+
+
 def test_RicciScalar_expr_property():
     x, y = sympy.symbols("x y")
     R = RicciScalar(x ** 2 * y * 3, (x, y))
     assert sympy.simplify(R._expr - R.expr) == 0
 
 
+def test_RicciTensor_and_RicciScalar_store_syms_as_tuple():
+    x, y = sympy.symbols("x y")
+    Rt = RicciTensor([[x, y], [y, x]], [x, y])
+    R = RicciScalar(x ** 2 * y * 3, [x, y])
+    assert Rt.syms == (x, y) and Rt.symbols() == (x, y)
+    assert R.syms == (x, y)
+
+
 def test_RicciScalar_raise_TypeError():
     x, y = sympy.symbols("x y")
     try:
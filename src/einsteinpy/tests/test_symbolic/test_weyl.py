@@ -1,3 +1,6 @@
+from itertools import product
+from multiprocessing import Pool
+
 import numpy as np
 import sympy
 from sympy import cos, sin, sinh
@@ -7,8 +10,10 @@ from einsteinpy.symbolic import (
     RicciScalar,
     RicciTensor,
     RiemannCurvatureTensor,
+    SchwarzschildMetric,
     WeylTensor,
 )
+from einsteinpy.symbolic.weyl import _weyl_numeric_kernel, _weyl_symbolic
 
 
 def spherical_metric():
@@ -90,6 +95,56 @@ def test_weyl_conformal_rescaling():
     assert w1.parent_metric == w1._parent_metric
 
 
+def test_weyl_numerical_metric():
+    syms = sympy.symbols("t x y z")
+    metric = MetricTensor(sympy.diag(-1.0, 1.0, 1.0, 1.0).tolist(), syms)
+    w = WeylTensor.from_metric(metric).tensor()
+    assert w == sympy.Array(np.zeros((4, 4, 4, 4))).applyfunc(sympy.Float)
+
+
+def test_weyl_numeric_kernel_matches_symbolic():
+    dims = 4
+    S = np.array([[2, 1, 0, 3], [1, 4, 2, 0], [0, 2, 5, 1], [3, 0, 1, 6]])
+    ricci = np.array([[1, 2, 0, 1], [2, 3, 1, 0], [0, 1, 2, 4], [1, 0, 4, 5]])
+    g = np.array([[-3, 1, 0, 0], [1, 2, 0, 1], [0, 0, 4, 2], [0, 1, 2, 5]])
+    # R_abcd = S_ac S_bd - S_ad S_bc has the symmetries of a Riemann Tensor,
+    # riemann[a, b, c, d] = R_adcb is the index layout of this package
+    riemann = np.zeros((dims, dims, dims, dims), dtype=int)
+    for a, b, c, d in product(range(dims), repeat=4):
+        riemann[a, b, c, d] = S[a, c] * S[d, b] - S[a, b] * S[d, c]
+    R = 7
+    numeric = _weyl_numeric_kernel(
+        riemann.astype(float),
+        ricci.astype(float),
+        g.astype(float),
+        float(R),
+        np.zeros((dims, dims, dims, dims)),
+    )
+    symbolic = _weyl_symbolic(
+        riemann.tolist(), ricci.tolist(), g.tolist(), sympy.Integer(R)
+    )
+    assert np.allclose(numeric, np.array(symbolic.tolist(), dtype=float))
+    assert not np.allclose(numeric, 0)
+
+
+def test_weyl_from_metric_is_cached():
+    mw1 = anti_de_sitter_metric()
+    w1 = WeylTensor.from_metric(mw1)
+    assert WeylTensor.from_metric(mw1) is w1
+    assert WeylTensor.from_metric(anti_de_sitter_metric()) is not w1
+
+
+def test_weyl_from_metric_cache_is_per_class():
+    class SubWeylTensor(WeylTensor):
+        pass
+
+    list_metric = np.ones((3, 3), dtype=int).tolist()
+    metric = MetricTensor(list_metric, sympy.symbols("t r theta"))
+    w = WeylTensor.from_metric(metric)
+    sub_w = SubWeylTensor.from_metric(metric)
+    assert type(w) is WeylTensor and type(sub_w) is SubWeylTensor
+
+
 def test_weyl_contraction_1st_3rd_indices_zero():
     mw1 = anti_de_sitter_metric()
     w1 = WeylTensor.from_metric(mw1)
@@ -98,3 +153,26 @@ def test_weyl_contraction_1st_3rd_indices_zero():
     )
     t0 = sympy.Array(np.zeros(shape=t1.shape, dtype=int))
     assert t1 == t0
+
+
+def test_weyl_pair_symmetries():
+    w = WeylTensor.from_metric(SchwarzschildMetric()).tensor()
+    dims = w.shape[0]
+    for i, k, l, m in product(range(dims), repeat=4):
+        assert w[i, k, l, m] == w[l, m, i, k]
+        assert w[i, k, l, m] == w[k, i, m, l]
+
+
+def _schwarzschild_weyl(parallel):
+    return WeylTensor.from_metric(SchwarzschildMetric(), parallel=parallel).tensor()
+
+
+def test_weyl_parallel_matches_serial():
+    assert _schwarzschild_weyl(True) == _schwarzschild_weyl(False)
+
+
+def test_weyl_parallel_inside_pool_worker():
+    # daemonic Pool workers can not start a pool, so they fall back to serial
+    with Pool(1) as pool:
+        (w,) = pool.map(_schwarzschild_weyl, [True])
+    assert w == _schwarzschild_weyl(False)